@@ -25,8 +25,10 @@ from keras_nlp.tests.test_case import TestCase
 
 
 class AlbertBackboneTest(TestCase):
-    def setUp(self):
-        self.backbone = AlbertBackbone(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.backbone = AlbertBackbone(
             vocabulary_size=10,
             num_layers=2,
             num_heads=2,
@@ -37,16 +39,27 @@ class AlbertBackboneTest(TestCase):
             intermediate_dim=4,
             max_sequence_length=5,
         )
-        self.batch_size = 8
-        self.input_batch = {
+        cls.batch_size = 8
+        cls.input_batch = {
             "token_ids": ops.ones((2, 5), dtype="int32"),
             "segment_ids": ops.ones((2, 5), dtype="int32"),
             "padding_mask": ops.ones((2, 5), dtype="int32"),
         }
 
-        self.input_dataset = tf.data.Dataset.from_tensor_slices(
-            self.input_batch
-        ).batch(2)
+        cls.input_dataset = (
+            tf.data.Dataset.from_tensor_slices(cls.input_batch)
+            .batch(2)
+            .cache()
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        cls.variable_length_batches = {
+            seq_length: {
+                "token_ids": ops.ones((2, seq_length), dtype="int32"),
+                "segment_ids": ops.ones((2, seq_length), dtype="int32"),
+                "padding_mask": ops.ones((2, seq_length), dtype="int32"),
+            }
+            for seq_length in (2, 3, 4)
+        }
 
     def test_valid_call_albert(self):
         self.backbone(self.input_batch)
@@ -56,14 +69,23 @@ class AlbertBackboneTest(TestCase):
         self.assertRegexpMatches(self.backbone.name, "albert_backbone")
 
     def test_variable_sequence_length_call_albert(self):
-        for seq_length in (2, 3, 4):
-            input_data = {
-                "token_ids": ops.ones((2, seq_length), dtype="int32"),
-                "segment_ids": ops.ones((2, seq_length), dtype="int32"),
-                "padding_mask": ops.ones((2, seq_length), dtype="int32"),
-            }
+        for input_data in self.variable_length_batches.values():
             self.backbone(input_data)
 
+    @pytest.mark.tf_only
+    def test_xla_call_albert(self):
+        xla_call = tf.function(self.backbone, jit_compile=True)
+        self.assertAllClose(
+            xla_call(self.input_batch)["pooled_output"],
+            self.backbone(self.input_batch)["pooled_output"],
+        )
+        for seq_length, input_data in self.variable_length_batches.items():
+            output = xla_call(input_data)
+            self.assertAllEqual(
+                ops.shape(output["sequence_output"]),
+                (2, seq_length, self.backbone.hidden_dim),
+            )
+
     def test_predict(self):
         self.backbone.predict(self.input_batch)
         self.backbone.predict(self.input_dataset)
@@ -118,18 +140,18 @@ class AlbertBackboneTPUTest(TestCase):
                 embedding_dim=16,
                 hidden_dim=2,
                 intermediate_dim=2,
-                max_sequence_length=4,
+                max_sequence_length=128,
             )
 
         self.input_batch = {
-            "token_ids": ops.ones((8, 128), dtype="int32"),
-            "segment_ids": ops.ones((8, 128), dtype="int32"),
-            "padding_mask": ops.ones((8, 128), dtype="int32"),
+            "token_ids": ops.ones((8, 32), dtype="int32"),
+            "segment_ids": ops.ones((8, 32), dtype="int32"),
+            "padding_mask": ops.ones((8, 32), dtype="int32"),
         }
         self.input_dataset = tf.data.Dataset.from_tensor_slices(
             self.input_batch
         ).batch(2)
 
     def test_predict(self):
-        self.backbone.compile()
+        self.backbone.compile(jit_compile=True)
         self.backbone.predict(self.input_dataset)
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for ALBERT masked language model."""
 
+import functools
 import io
 import os
 
@@ -30,36 +31,40 @@ from keras_nlp.models.albert.albert_tokenizer import AlbertTokenizer
 from keras_nlp.tests.test_case import TestCase
 
 
-class AlbertMaskedLMTest(TestCase):
-    def setUp(self):
-        # Setup model.
-        vocab_data = tf.data.Dataset.from_tensor_slices(
-            ["the quick brown fox", "the earth is round", "an eagle flew"]
-        )
+@functools.lru_cache(maxsize=1)
+def _train_test_proto():
+    """Train a tiny SentencePiece model, caching the proto for the session."""
+    vocab_data = tf.data.Dataset.from_tensor_slices(
+        ["the quick brown fox", "the earth is round", "an eagle flew"]
+    )
+    bytes_io = io.BytesIO()
+    sentencepiece.SentencePieceTrainer.train(
+        sentence_iterator=vocab_data.as_numpy_iterator(),
+        model_writer=bytes_io,
+        vocab_size=15,
+        model_type="WORD",
+        pad_id=0,
+        unk_id=1,
+        bos_id=2,
+        eos_id=3,
+        pad_piece="<pad>",
+        unk_piece="<unk>",
+        bos_piece="[CLS]",
+        eos_piece="[SEP]",
+        user_defined_symbols="[MASK]",
+    )
+    return bytes_io.getvalue()
 
-        bytes_io = io.BytesIO()
-        sentencepiece.SentencePieceTrainer.train(
-            sentence_iterator=vocab_data.as_numpy_iterator(),
-            model_writer=bytes_io,
-            vocab_size=15,
-            model_type="WORD",
-            pad_id=0,
-            unk_id=1,
-            bos_id=2,
-            eos_id=3,
-            pad_piece="<pad>",
-            unk_piece="<unk>",
-            bos_piece="[CLS]",
-            eos_piece="[SEP]",
-            user_defined_symbols="[MASK]",
-        )
-
-        proto = bytes_io.getvalue()
 
-        tokenizer = AlbertTokenizer(proto=proto)
+class AlbertMaskedLMTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Setup model.
+        cls.tokenizer = AlbertTokenizer(proto=_train_test_proto())
 
-        self.preprocessor = AlbertMaskedLMPreprocessor(
-            tokenizer=tokenizer,
+        cls.preprocessor = AlbertMaskedLMPreprocessor(
+            tokenizer=cls.tokenizer,
             # Simplify out testing by masking every available token.
             mask_selection_rate=1.0,
             mask_token_rate=1.0,
@@ -67,6 +72,26 @@ class AlbertMaskedLMTest(TestCase):
             mask_selection_length=5,
             sequence_length=5,
         )
+
+        cls.raw_batch = [
+            "quick brown fox",
+            "eagle flew over fox",
+            "the eagle flew quick",
+            "a brown eagle",
+        ]
+        # Masking is deterministic with the rates above, so the preprocessed
+        # dataset can be cached and shared by the `fit()` tests.
+        cls.preprocessed_batch = cls.preprocessor(cls.raw_batch)[0]
+        cls.raw_dataset = tf.data.Dataset.from_tensor_slices(
+            cls.raw_batch
+        ).batch(2)
+        cls.preprocessed_dataset = (
+            cls.raw_dataset.take(1).map(cls.preprocessor).cache()
+        )
+
+    def setUp(self):
+        # Tests train the model and mutate its preprocessor and compile
+        # state, so build a fresh backbone and task model for each test.
         self.backbone = AlbertBackbone(
             vocabulary_size=self.preprocessor.tokenizer.vocabulary_size(),
             num_layers=2,
@@ -85,23 +110,11 @@ class AlbertMaskedLMTest(TestCase):
             preprocessor=None,
         )
 
-        self.raw_batch = [
-            "quick brown fox",
-            "eagle flew over fox",
-            "the eagle flew quick",
-            "a brown eagle",
-        ]
-        self.preprocessed_batch = self.preprocessor(self.raw_batch)[0]
-        self.raw_dataset = tf.data.Dataset.from_tensor_slices(
-            self.raw_batch
-        ).batch(2)
-        self.preprocessed_dataset = self.raw_dataset.map(self.preprocessor)
-
     def test_valid_call_classifier(self):
         self.masked_lm(self.preprocessed_batch)
 
     def test_albert_masked_lm_fit_default_compile(self):
-        self.masked_lm.fit(self.raw_dataset)
+        self.masked_lm.fit(self.raw_dataset.take(1))
 
     def test_classifier_predict(self):
         self.masked_lm.predict(self.raw_batch)
@@ -109,7 +122,7 @@ class AlbertMaskedLMTest(TestCase):
         self.masked_lm.predict(self.preprocessed_batch)
 
     def test_classifier_fit(self):
-        self.masked_lm.fit(self.raw_dataset)
+        self.masked_lm.fit(self.raw_dataset.take(1))
         self.masked_lm.preprocessor = None
         self.masked_lm.fit(self.preprocessed_dataset)
 
@@ -52,15 +52,17 @@ class OPTTokenizerTest(TestCase):
         output = self.tokenizer(input_data)
         self.assertAllEqual(output, [2, 3, 4, 2, 5])
 
-    def test_tokenize_special_tokens(self):
-        input_data = "</s> airplane at airport</s><pad>"
-        output = self.tokenizer(input_data)
-        self.assertAllEqual(output, [1, 2, 3, 4, 2, 5, 1, 0])
-
     def test_tokenize_batch(self):
-        input_data = [" airplane at airport", " kohli is the best"]
+        input_data = [
+            " airplane at airport",
+            " kohli is the best",
+            "</s> airplane at airport</s><pad>",
+        ]
         output = self.tokenizer(input_data)
-        self.assertAllEqual(output, [[2, 3, 4, 2, 5], [6, 7, 8, 9, 10]])
+        self.assertAllEqual(output[0], [2, 3, 4, 2, 5])
+        self.assertAllEqual(output[1], [6, 7, 8, 9, 10])
+        # Special tokens.
+        self.assertAllEqual(output[2], [1, 2, 3, 4, 2, 5, 1, 0])
 
     def test_detokenize(self):
         input_tokens = [2, 3, 4, 2, 5]
@@ -25,8 +25,10 @@ from keras_nlp.tests.test_case import TestCase
 
 
 class RobertaBackboneTest(TestCase):
-    def setUp(self):
-        self.backbone = RobertaBackbone(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.backbone = RobertaBackbone(
             vocabulary_size=10,
             num_layers=2,
             num_heads=2,
@@ -34,15 +36,25 @@ class RobertaBackboneTest(TestCase):
             intermediate_dim=4,
             max_sequence_length=5,
         )
-        self.batch_size = 8
-        self.input_batch = {
+        cls.batch_size = 8
+        cls.input_batch = {
             "token_ids": ops.ones((2, 5), dtype="int32"),
             "padding_mask": ops.ones((2, 5), dtype="int32"),
         }
 
-        self.input_dataset = tf.data.Dataset.from_tensor_slices(
-            self.input_batch
-        ).batch(2)
+        cls.input_dataset = (
+            tf.data.Dataset.from_tensor_slices(cls.input_batch)
+            .batch(2)
+            .cache()
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        cls.variable_length_batches = {
+            seq_length: {
+                "token_ids": ops.ones((2, seq_length), dtype="int32"),
+                "padding_mask": ops.ones((2, seq_length), dtype="int32"),
+            }
+            for seq_length in (2, 3, 4)
+        }
 
     def test_valid_call_roberta(self):
         self.backbone(self.input_batch)
@@ -65,17 +77,27 @@ class RobertaBackboneTest(TestCase):
         self.assertEqual(new_backbone.get_config(), self.backbone.get_config())
 
     def test_variable_sequence_length_call_roberta(self):
-        for seq_length in (2, 3, 4):
-            input_data = {
-                "token_ids": ops.ones((2, seq_length), dtype="int32"),
-                "padding_mask": ops.ones((2, seq_length), dtype="int32"),
-            }
+        for seq_length, input_data in self.variable_length_batches.items():
             output = self.backbone(input_data)
             self.assertAllEqual(
                 ops.shape(output),
                 (2, seq_length, self.backbone.hidden_dim),
             )
 
+    @pytest.mark.tf_only
+    def test_xla_call_roberta(self):
+        xla_call = tf.function(self.backbone, jit_compile=True)
+        self.assertAllClose(
+            xla_call(self.input_batch),
+            self.backbone(self.input_batch),
+        )
+        for seq_length, input_data in self.variable_length_batches.items():
+            output = xla_call(input_data)
+            self.assertAllEqual(
+                ops.shape(output),
+                (2, seq_length, self.backbone.hidden_dim),
+            )
+
     @pytest.mark.large  # Saving is slow, so mark these large.
     def test_saved_model(self):
         model_output = self.backbone(self.input_batch)
@@ -105,13 +127,13 @@ class RobertaBackboneTPUTest(TestCase):
                 max_sequence_length=128,
             )
         self.input_batch = {
-            "token_ids": ops.ones((8, 128), dtype="int32"),
-            "padding_mask": ops.ones((8, 128), dtype="int32"),
+            "token_ids": ops.ones((8, 32), dtype="int32"),
+            "padding_mask": ops.ones((8, 32), dtype="int32"),
         }
         self.input_dataset = tf.data.Dataset.from_tensor_slices(
             self.input_batch
         ).batch(2)
 
     def test_predict(self):
-        self.backbone.compile()
+        self.backbone.compile(jit_compile=True)
         self.backbone.predict(self.input_dataset)